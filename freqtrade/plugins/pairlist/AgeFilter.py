@@ -2,7 +2,6 @@
 Minimum age (days listed) pair list filter
 """
 import logging
-from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
 import arrow
@@ -82,10 +81,11 @@ class AgeFilter(IPairList):
                        .float_timestamp) * 1000
         candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms, cache=False)
         if self._enabled:
-            for p in deepcopy(pairlist):
-                daily_candles = candles[(p, '1d')] if (p, '1d') in candles else None
-                if not self._validate_pair_loc(p, daily_candles):
-                    pairlist.remove(p)
+            pairlist = [
+                p for p in pairlist
+                if self._validate_pair_loc(
+                    p, candles[(p, '1d')] if (p, '1d') in candles else None)
+            ]
         self.log_once(f"Validated {len(pairlist)} pairs.", logger.info)
         return pairlist
 
@@ -3,8 +3,7 @@ PairList Handler base class
 """
 import logging
 from abc import ABC, abstractmethod, abstractproperty
-from copy import deepcopy
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set
 
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange, market_is_active
@@ -106,11 +105,9 @@ class IPairList(LoggingMixin, ABC):
         :return: new whitelist
         """
         if self._enabled:
-            # Copy list since we're modifying this list
-            for p in deepcopy(pairlist):
-                # Filter out assets
-                if not self._validate_pair(p, tickers[p] if p in tickers else {}):
-                    pairlist.remove(p)
+            # Filter out assets
+            pairlist = [p for p in pairlist
+                        if self._validate_pair(p, tickers[p] if p in tickers else {})]
 
         return pairlist
 
@@ -146,7 +143,9 @@ class IPairList(LoggingMixin, ABC):
             raise OperationalException(
                 'Markets not loaded. Make sure that exchange is initialized correctly.')
 
+        stake_currency = self._config['stake_currency']
         sanitized_whitelist: List[str] = []
+        seen_pairs: Set[str] = set()
         for pair in pairlist:
             # pair is not in the generated dynamic market or has the wrong stake currency
             if pair not in markets:
@@ -155,23 +154,24 @@ class IPairList(LoggingMixin, ABC):
                               logger.warning)
                 continue
 
-            if not self._exchange.market_is_tradable(markets[pair]):
+            market = markets[pair]
+            if not self._exchange.market_is_tradable(market):
                 self.log_once(f"Pair {pair} is not tradable with Freqtrade."
                               "Removing it from whitelist..", logger.warning)
                 continue
 
-            if self._exchange.get_pair_quote_currency(pair) != self._config['stake_currency']:
+            if self._exchange.get_pair_quote_currency(pair) != stake_currency:
                 self.log_once(f"Pair {pair} is not compatible with your stake currency "
-                              f"{self._config['stake_currency']}. Removing it from whitelist..",
+                              f"{stake_currency}. Removing it from whitelist..",
                               logger.warning)
                 continue
 
             # Check if market is active
-            market = markets[pair]
             if not market_is_active(market):
                 self.log_once(f"Ignoring {pair} from whitelist. Market is not active.", logger.info)
                 continue
-            if pair not in sanitized_whitelist:
+            if pair not in seen_pairs:
+                seen_pairs.add(pair)
                 sanitized_whitelist.append(pair)
 
         # We need to remove pairs that are unknown
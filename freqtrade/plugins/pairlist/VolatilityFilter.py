@@ -3,7 +3,6 @@ Volatility pairlist filter
 """
 import logging
 import sys
-from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
 import arrow
@@ -80,10 +79,11 @@ class VolatilityFilter(IPairList):
                                                           cache=False)
 
         if self._enabled:
-            for p in deepcopy(pairlist):
-                daily_candles = candles[(p, '1d')] if (p, '1d') in candles else None
-                if not self._validate_pair_loc(p, daily_candles):
-                    pairlist.remove(p)
+            pairlist = [
+                p for p in pairlist
+                if self._validate_pair_loc(
+                    p, candles[(p, '1d')] if (p, '1d') in candles else None)
+            ]
         return pairlist
 
     def _validate_pair_loc(self, pair: str, daily_candles: Optional[DataFrame]) -> bool:
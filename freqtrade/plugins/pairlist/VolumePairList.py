@@ -119,11 +119,11 @@ class VolumePairList(IPairList):
         else:
             # Use fresh pairlist
             # Check if pair quote currency equals to the stake currency.
-            filtered_tickers = [
-                v for k, v in tickers.items()
-                if (self._exchange.get_pair_quote_currency(k) == self._stake_currency
+            get_quote = self._exchange.get_pair_quote_currency
+            pairlist = [
+                v['symbol'] for k, v in tickers.items()
+                if (get_quote(k) == self._stake_currency
                     and v[self._sort_key] is not None)]
-            pairlist = [s['symbol'] for s in filtered_tickers]
 
             pairlist = self.filter_pairlist(pairlist, tickers)
             self._pair_cache['pairlist'] = pairlist.copy()
@@ -139,7 +139,8 @@ class VolumePairList(IPairList):
         :return: new whitelist
         """
         # Use the incoming pairlist.
-        filtered_tickers = [v for k, v in tickers.items() if k in pairlist]
+        pairs_set = set(pairlist)
+        filtered_tickers = [v for k, v in tickers.items() if k in pairs_set]
 
         # get lookback period in ms, for exchange ohlcv fetch
         if self._use_range:
@@ -2,7 +2,6 @@
 Rate of change pairlist filter
 """
 import logging
-from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
 import arrow
@@ -78,10 +77,11 @@ class RangeStabilityFilter(IPairList):
                                                           cache=False)
 
         if self._enabled:
-            for p in deepcopy(pairlist):
-                daily_candles = candles[(p, '1d')] if (p, '1d') in candles else None
-                if not self._validate_pair_loc(p, daily_candles):
-                    pairlist.remove(p)
+            pairlist = [
+                p for p in pairlist
+                if self._validate_pair_loc(
+                    p, candles[(p, '1d')] if (p, '1d') in candles else None)
+            ]
         return pairlist
 
     def _validate_pair_loc(self, pair: str, daily_candles: Optional[DataFrame]) -> bool:
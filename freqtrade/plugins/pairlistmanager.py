@@ -2,7 +2,6 @@
 PairList manager class
 """
 import logging
-from copy import deepcopy
 from typing import Dict, List
 
 from cachetools import TTLCache, cached
@@ -104,15 +103,17 @@ class PairListManager():
         :return: pairlist - blacklisted pairs
         """
         try:
-            blacklist = self.expanded_blacklist
+            blacklist = set(self.expanded_blacklist)
         except ValueError as err:
             logger.error(f"Pair blacklist contains an invalid Wildcard: {err}")
             return []
-        for pair in deepcopy(pairlist):
+        whitelist: List[str] = []
+        for pair in pairlist:
             if pair in blacklist:
                 logmethod(f"Pair {pair} in your blacklist. Removing it from whitelist...")
-                pairlist.remove(pair)
-        return pairlist
+                continue
+            whitelist.append(pair)
+        return whitelist
 
     def verify_whitelist(self, pairlist: List[str], logmethod,
                          keep_invalid: bool = False) -> List[str]:
@@ -112,7 +112,7 @@ class CryptoToFiatConverter:
         if crypto_symbol == 'usd':
             # usd corresponds to "uniswap-state-dollar" for coingecko.
             # We'll therefore need to "swap" the currencies
-            logger.info(f"reversing Rates {crypto_symbol}, {fiat_symbol}")
+            logger.info("reversing Rates %s, %s", crypto_symbol, fiat_symbol)
             crypto_symbol = fiat_symbol
             fiat_symbol = 'usd'
             inverse = True
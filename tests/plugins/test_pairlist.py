@@ -1147,6 +1147,9 @@ def test_expand_pairlist(wildcardlist, pairs, expected):
      ['BTC/USDT', 'ETC/USDT', 'ETH/USDT', 'BTCUP/USDT', 'XRPUP/USDT', 'XRPDOWN/USDT'],
      None),
     (['HELLO/WORLD'], [], ['HELLO/WORLD']),  # Invalid pair kept
+    (['A!', 'B!', 'BTC/USDT'],
+     ['BTC/USDT'],
+     ['BTC/USDT']),  # Consecutive malformed pairs dropped
     (['BTC/USD'],
      ['BTC/USD', 'BTC/USDT'],
      ['BTC/USD']),